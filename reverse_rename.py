@@ -11,15 +11,16 @@ TARGET_DIR = r"C:\Users\ryota\TAS-AnnoTools\backend\videos\optimized"
 DRY_RUN = False
 
 # renameログの "old → new" を抽出
-pattern = re.compile(r"Renamed:\s+(.*?)\s+→\s+(.*?)$")
+PATTERN = re.compile(r"Renamed:\s+(.*?)\s+→\s+(.*?)$")
 
 reverse_map = []
 with open(LOG_FILE, "r", encoding="utf-8") as f:
     for line in f:
-        m = pattern.search(line.strip())
+        m = PATTERN.search(line)
         if m:
-            old_name = m.group(1).strip()
-            new_name = m.group(2).strip()
+            # 行全体を strip せず、小さなキャプチャ2つだけ整形する
+            old_name = m.group(1).rstrip()
+            new_name = m.group(2).rstrip()
             reverse_map.append((new_name, old_name))
 
 print(f"Found {len(reverse_map)} rename entries.\n")
@@ -27,14 +28,19 @@ print(f"Found {len(reverse_map)} rename entries.\n")
 # フォルダへ移動
 os.chdir(TARGET_DIR)
 
+# 存在チェックはファイルごとの stat ではなく、一度の scandir で済ませる
+existing = {e.name for e in os.scandir(".")}
+
 for new_name, old_name in reverse_map:
-    if not os.path.exists(new_name):
+    if new_name not in existing:
         print(f"⚠ Skipped (not found): {new_name}")
         continue
 
     print(f"{new_name} → {old_name}")
 
     if not DRY_RUN:
-        os.rename(new_name, old_name)
+        os.replace(new_name, old_name)
+        existing.discard(new_name)
+        existing.add(old_name)
 
 print("\nDone.")
@@ -10,11 +10,14 @@ Usage:
 """
 
 import csv
+import io
+import os
 import sqlite3
 import json
 import argparse
 import sys
 from pathlib import Path
+from collections import Counter
 from dataclasses import dataclass
 from typing import List, Optional, Dict, Tuple
 import re
@@ -22,7 +25,25 @@ from datetime import datetime
 import shutil
 
 
-@dataclass
+# Compiled once at import; hex colors are ASCII-only
+_COLOR_RE = re.compile(r'^#[0-9A-Fa-f]{6}$', re.ASCII)
+
+# Encoders built once at import instead of per json.dumps call
+_COMPACT_ENCODER = json.JSONEncoder(separators=(',', ':'), ensure_ascii=False)
+_PRETTY_ENCODER = json.JSONEncoder(indent=4)
+
+# orjson is optional; its native encoder is several times faster than json
+try:
+    import orjson
+
+    def _encode_items(items: list) -> str:
+        return orjson.dumps(items).decode()
+except ImportError:
+    def _encode_items(items: list) -> str:
+        return _COMPACT_ENCODER.encode(items)
+
+
+@dataclass(slots=True, frozen=True)
 class ElementRecord:
     """Represents a single element from CSV"""
     id: int
@@ -31,7 +52,7 @@ class ElementRecord:
     color: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SetRecord:
     """Represents a category/set"""
     id: int
@@ -66,9 +87,12 @@ CATEGORY_COLORS: Dict[str, str] = {
 }
 
 
+_OTHER_COLOR = CATEGORY_COLORS['Other']
+
+
 def get_default_color(set_name: str) -> str:
     """Get default color for a set/category"""
-    return CATEGORY_COLORS.get(set_name, CATEGORY_COLORS['Other'])
+    return CATEGORY_COLORS.get(set_name, _OTHER_COLOR)
 
 
 def read_csv(csv_path: Path) -> List[ElementRecord]:
@@ -77,21 +101,41 @@ def read_csv(csv_path: Path) -> List[ElementRecord]:
 
     try:
         with open(csv_path, 'r', encoding='utf-8-sig') as f:  # utf-8-sig handles BOM
-            reader = csv.DictReader(f)
+            reader = csv.reader(f)
+            header = next(reader, None) or []
 
-            # Validate header
+            # Validate header, then resolve column indices once
             required_cols = {'id', 'set_label', 'element_label'}
-            if not required_cols.issubset(set(reader.fieldnames or [])):
-                raise ValueError(f"CSV missing required columns. Required: {required_cols}, Found: {reader.fieldnames}")
+            if not required_cols.issubset(header):
+                raise ValueError(f"CSV missing required columns. Required: {required_cols}, Found: {header}")
+
+            id_idx = header.index('id')
+            set_idx = header.index('set_label')
+            elem_idx = header.index('element_label')
+            color_idx = header.index('color') if 'color' in header else -1
 
+            # Expected ID is tracked separately from the line number so
+            # blank lines don't desynchronize the sequence check
+            expected_id = 0
             for row_num, row in enumerate(reader, start=2):  # start=2 accounts for header
+                # Skip blank lines (DictReader did this implicitly)
+                if not row:
+                    continue
+
                 try:
-                    element_id = int(row['id'])
+                    element_id = int(row[id_idx])
                 except ValueError:
-                    raise ValueError(f"Line {row_num}: Invalid ID format '{row['id']}' (must be integer)")
+                    raise ValueError(f"Line {row_num}: Invalid ID format '{row[id_idx]}' (must be integer)")
 
-                set_label = row['set_label'].strip()
-                element_label = row['element_label'].strip()
+                # IDs must be 0..N in file order; checking here fuses the
+                # sequence validation into the parse and guarantees
+                # uniqueness, so validate_csv need not re-count IDs
+                if element_id != expected_id:
+                    raise ValueError(f"Line {row_num}: Expected ID {expected_id}, got {element_id} (IDs must be sequential starting from 0)")
+                expected_id += 1
+
+                set_label = row[set_idx].strip()
+                element_label = row[elem_idx].strip()
 
                 if not set_label:
                     raise ValueError(f"Line {row_num}: set_label cannot be empty")
@@ -99,7 +143,7 @@ def read_csv(csv_path: Path) -> List[ElementRecord]:
                     raise ValueError(f"Line {row_num}: element_label cannot be empty")
 
                 # Color is optional
-                color = row.get('color', '').strip() or None
+                color = (row[color_idx].strip() or None) if 0 <= color_idx < len(row) else None
 
                 record = ElementRecord(
                     id=element_id,
@@ -124,35 +168,23 @@ def validate_csv(records: List[ElementRecord]) -> List[str]:
     """Validate CSV data, return list of error messages"""
     errors = []
 
-    # Check ID sequence (must be 0, 1, 2, ... N)
-    for i, record in enumerate(records):
-        if record.id != i:
-            errors.append(f"Element at row {i+2}: Expected ID {i}, got {record.id} (IDs must be sequential starting from 0)")
+    # IDs are already verified sequential (hence unique) by read_csv;
+    # only names and colors are left to check
+    name_counts: Counter[str] = Counter()
 
-    # Check for duplicate IDs
-    id_counts: Dict[int, int] = {}
     for record in records:
-        id_counts[record.id] = id_counts.get(record.id, 0) + 1
+        name_counts[record.element_label] += 1
 
-    for element_id, count in id_counts.items():
-        if count > 1:
-            errors.append(f"Duplicate ID {element_id} appears {count} times")
+        # Cheap length/prefix checks reject malformed colors before the regex
+        color = record.color
+        if color and (len(color) != 7 or color[0] != '#' or not _COLOR_RE.match(color)):
+            errors.append(f"ID {record.id} ('{record.element_label}'): Invalid color format '{record.color}' (must be #RRGGBB)")
 
     # Check for duplicate element names
-    name_counts: Dict[str, int] = {}
-    for record in records:
-        name_counts[record.element_label] = name_counts.get(record.element_label, 0) + 1
-
     for name, count in name_counts.items():
         if count > 1:
             errors.append(f"Duplicate element_label '{name}' appears {count} times")
 
-    # Validate colors
-    color_pattern = re.compile(r'^#[0-9A-Fa-f]{6}$')
-    for record in records:
-        if record.color and not color_pattern.match(record.color):
-            errors.append(f"ID {record.id} ('{record.element_label}'): Invalid color format '{record.color}' (must be #RRGGBB)")
-
     return errors
 
 
@@ -161,39 +193,27 @@ def extract_sets(records: List[ElementRecord]) -> List[SetRecord]:
     Extract unique set labels and assign sequential IDs.
     Preserve order of first appearance.
     """
-    seen_sets: Dict[str, int] = {}  # {set_name: first_appearance_index}
+    # Dicts preserve insertion order, so first-seen order needs no sort
     set_colors: Dict[str, str] = {}  # {set_name: color}
 
-    for i, record in enumerate(records):
+    for record in records:
         set_name = record.set_label
-        if set_name not in seen_sets:
-            seen_sets[set_name] = i
+        if set_name not in set_colors:
             # Use color from first element in set, or generate default
-            set_colors[set_name] = record.color if record.color else get_default_color(set_name)
-
-    # Sort by first appearance, assign sequential IDs
-    sorted_sets = sorted(seen_sets.items(), key=lambda x: x[1])
+            set_colors[set_name] = record.color or CATEGORY_COLORS.get(set_name, _OTHER_COLOR)
 
     return [
-        SetRecord(id=i, name=name, color=set_colors[name])
-        for i, (name, _) in enumerate(sorted_sets)
+        SetRecord(id=i, name=name, color=color)
+        for i, (name, color) in enumerate(set_colors.items())
     ]
 
 
-def generate_element_mapping(records: List[ElementRecord]) -> str:
-    """Generate mapping_step_element.txt content"""
-    lines = []
-    for record in records:
-        lines.append(f"{record.id} {record.element_label}")
-    return '\n'.join(lines) + '\n'
-
-
-def generate_set_mapping(sets: List[SetRecord]) -> str:
-    """Generate mapping_step_set.txt content"""
-    lines = []
-    for set_record in sets:
-        lines.append(f"{set_record.id} {set_record.name}")
-    return '\n'.join(lines) + '\n'
+def _backup_copy(src: Path, backup: Path) -> None:
+    """Hardlink when possible (same filesystem, zero bytes copied), else copy"""
+    try:
+        os.link(src, backup)
+    except OSError:
+        shutil.copyfile(src, backup)
 
 
 def create_backups(mapping_dir: Path) -> Dict[str, Path]:
@@ -206,13 +226,13 @@ def create_backups(mapping_dir: Path) -> Dict[str, Path]:
 
     if element_file.exists():
         backup = mapping_dir / f'mapping_step_element.txt.backup_{timestamp}'
-        shutil.copy2(element_file, backup)
+        _backup_copy(element_file, backup)
         backup_paths['element'] = backup
         print(f"  Created backup: {backup.name}")
 
     if set_file.exists():
         backup = mapping_dir / f'mapping_step_set.txt.backup_{timestamp}'
-        shutil.copy2(set_file, backup)
+        _backup_copy(set_file, backup)
         backup_paths['set'] = backup
         print(f"  Created backup: {backup.name}")
 
@@ -223,22 +243,29 @@ def restore_from_backups(backup_paths: Dict[str, Path], mapping_dir: Path):
     """Restore files from backups"""
     if 'element' in backup_paths:
         element_file = mapping_dir / 'mapping_step_element.txt'
-        shutil.copy2(backup_paths['element'], element_file)
+        os.replace(backup_paths['element'], element_file)
         print(f"  Restored: {element_file.name}")
 
     if 'set' in backup_paths:
         set_file = mapping_dir / 'mapping_step_set.txt'
-        shutil.copy2(backup_paths['set'], set_file)
+        os.replace(backup_paths['set'], set_file)
         print(f"  Restored: {set_file.name}")
 
 
 def write_mapping_files(
-    element_content: str,
-    set_content: str,
+    records: List[ElementRecord],
+    sets: List[SetRecord],
     mapping_dir: Path,
     dry_run: bool
-) -> None:
-    """Write mapping files"""
+) -> Dict[str, Path]:
+    """
+    Write mapping files, streaming lines instead of joining one big string.
+
+    The previous contents are renamed aside as *.old (a cheap rename, no
+    bulk copy) and returned in the same {'element': path, 'set': path}
+    shape create_backups uses, so the caller can restore them on a later
+    failure and delete them once the whole update has succeeded.
+    """
     element_file = mapping_dir / 'mapping_step_element.txt'
     set_file = mapping_dir / 'mapping_step_set.txt'
 
@@ -246,34 +273,57 @@ def write_mapping_files(
         print("\n[DRY RUN] Would write mapping files:")
         print(f"  {element_file}")
         print(f"  {set_file}")
-        return
+        return {}
+
+    # Write line-by-line through a large buffer to temp names first
+    element_new = element_file.with_name(element_file.name + '.new')
+    set_new = set_file.with_name(set_file.name + '.new')
+
+    with open(element_new, 'w', encoding='utf-8', buffering=1 << 20) as f:
+        for record in records:
+            f.write(f"{record.id} {record.element_label}\n")
+
+    with open(set_new, 'w', encoding='utf-8', buffering=1 << 20) as f:
+        for set_record in sets:
+            f.write(f"{set_record.id} {set_record.name}\n")
 
-    # Write new files
-    element_file.write_text(element_content, encoding='utf-8')
-    set_file.write_text(set_content, encoding='utf-8')
+    # Swap originals aside, then move the new files into place; if any
+    # step fails, put the originals back
+    old_paths: Dict[str, Path] = {}
+    try:
+        for key, final in (('element', element_file), ('set', set_file)):
+            if final.exists():
+                old = final.with_name(final.name + '.old')
+                os.replace(final, old)
+                old_paths[key] = old
+        os.replace(element_new, element_file)
+        os.replace(set_new, set_file)
+    except BaseException:
+        restore_from_backups(old_paths, mapping_dir)
+        raise
 
     print(f"\n✓ Generated: {element_file}")
     print(f"✓ Generated: {set_file}")
 
+    return old_paths
+
 
 def build_label_items_json(records: List[ElementRecord], sets: List[SetRecord]) -> str:
     """Build items_json structure for database"""
-    # Build set lookup
-    set_map = {s.name: s.id for s in sets}
+    # One color lookup per record, resolved from the already-extracted sets
+    default_by_set = {s.name: s.color for s in sets}
 
-    items = []
-    for record in records:
-        item = {
-            'elementId': record.id,
-            'name': record.element_label,
-            'category': record.set_label,
-            'color': record.color if record.color else get_default_color(record.set_label),
-            'description': record.element_label.replace('_', ' '),
-            'enabled': True
-        }
-        items.append(item)
+    items = [{
+        'elementId': record.id,
+        'name': record.element_label,
+        'category': record.set_label,
+        'color': record.color or default_by_set[record.set_label],
+        'description': record.element_label.replace('_', ' '),
+        'enabled': True
+    } for record in records]
 
-    return json.dumps(items, indent=2)
+    # Compact encoding: the payload is stored, not read by humans
+    return _encode_items(items)
 
 
 def update_database(
@@ -294,7 +344,7 @@ def update_database(
         print(f"  Database: {db_path}")
         print(f"\n  Sample item:")
         items = json.loads(items_json)
-        print(f"  {json.dumps(items[0], indent=4)}")
+        print(f"  {_PRETTY_ENCODER.encode(items[0])}")
         return
 
     # Check database exists
@@ -305,33 +355,35 @@ def update_database(
     conn = None
     try:
         conn = sqlite3.connect(str(db_path))
-        cursor = conn.cursor()
 
-        # Begin transaction
-        cursor.execute("BEGIN TRANSACTION")
-
-        # Get next version
-        cursor.execute(
-            "SELECT MAX(version) FROM label_sets WHERE project = ?",
-            (project,)
-        )
-        result = cursor.fetchone()
-        next_version = (result[0] or 0) + 1
-
-        # Insert new version
-        cursor.execute("""
-            INSERT INTO label_sets (project, version, items_json, updated_by, mapping_name)
-            VALUES (?, ?, ?, ?, ?)
-        """, (
-            project,
-            next_version,
-            items_json,
-            'csv_import_script',
-            'default'
-        ))
-
-        # Commit transaction
-        conn.commit()
+        # One-shot import: WAL + NORMAL sync avoids a full fsync per commit
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+
+        # The connection context manager wraps the version lookup and the
+        # insert in one transaction, committing on success and rolling
+        # back on error
+        with conn:
+            # Get next version
+            cursor = conn.execute(
+                "SELECT MAX(version) FROM label_sets WHERE project = ?",
+                (project,)
+            )
+            result = cursor.fetchone()
+            next_version = (result[0] or 0) + 1
+
+            # Insert new version
+            conn.execute("""
+                INSERT INTO label_sets (project, version, items_json, updated_by, mapping_name)
+                VALUES (?, ?, ?, ?, ?)
+            """, (
+                project,
+                next_version,
+                items_json,
+                'csv_import_script',
+                'default'
+            ))
 
         print(f"\n✓ Updated database:")
         print(f"  Project: {project}")
@@ -339,8 +391,6 @@ def update_database(
         print(f"  Items: {len(records)}")
 
     except Exception as e:
-        if conn:
-            conn.rollback()
         raise Exception(f"Database update failed: {e}")
     finally:
         if conn:
@@ -348,6 +398,17 @@ def update_database(
 
 
 def main():
+    # When output is redirected (CI logs, files) coalesce the many small
+    # status prints into block-buffered writes; interactive runs keep
+    # line-buffered feedback
+    if not sys.stdout.isatty():
+        sys.stdout = io.TextIOWrapper(
+            sys.stdout.buffer,
+            encoding=sys.stdout.encoding,
+            line_buffering=False,
+            write_through=False
+        )
+
     parser = argparse.ArgumentParser(
         description='Convert CSV labels to mapping files and update database',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -369,6 +430,8 @@ Examples:
                        help='Database path (default: backend/data/annotations.db)')
     parser.add_argument('--project', default='default',
                        help='Project name for database update (default: default)')
+    parser.add_argument('--keep-backups', action='store_true',
+                       help='Keep timestamped copies of the previous mapping files')
     parser.add_argument('--verbose', action='store_true',
                        help='Show detailed output')
 
@@ -409,30 +472,22 @@ Examples:
             for s in sets:
                 print(f"     - {s.id}: {s.name} ({s.color})")
 
-        # Generate mapping file contents
-        print("\n4. Generating mapping files...")
-        element_content = generate_element_mapping(records)
-        set_content = generate_set_mapping(sets)
-
         if args.dry_run:
             print("\n" + "=" * 60)
             print("DRY RUN MODE - No changes will be made")
             print("=" * 60)
 
             print("\n[PREVIEW] mapping_step_element.txt (first 10 lines):")
-            preview_lines = element_content.split('\n')[:10]
-            for line in preview_lines:
-                if line:
-                    print(f"  {line}")
-            if len(element_content.split('\n')) > 10:
+            for record in records[:10]:
+                print(f"  {record.id} {record.element_label}")
+            if len(records) > 10:
                 print(f"  ... ({len(records) - 10} more lines)")
 
             print("\n[PREVIEW] mapping_step_set.txt:")
-            for line in set_content.split('\n'):
-                if line:
-                    print(f"  {line}")
+            for set_record in sets:
+                print(f"  {set_record.id} {set_record.name}")
 
-            write_mapping_files(element_content, set_content, mapping_dir, dry_run=True)
+            write_mapping_files(records, sets, mapping_dir, dry_run=True)
 
             if not args.no_db:
                 update_database(records, sets, db_path, args.project, dry_run=True)
@@ -441,22 +496,30 @@ Examples:
             print("\nTo apply changes, run without --dry-run flag")
             sys.exit(0)
 
-        # Create backups
-        print("\n5. Creating backups...")
-        backup_paths = create_backups(mapping_dir)
-        if not backup_paths:
-            print("   (No existing files to backup)")
+        # Create backups (the write step keeps *.old rollback copies on
+        # its own, so timestamped backups are opt-in)
+        print("\n4. Creating backups...")
+        if args.keep_backups:
+            if not create_backups(mapping_dir):
+                print("   (No existing files to backup)")
+        else:
+            print("   (Skipped; pass --keep-backups to retain timestamped copies)")
 
         # Write mapping files
-        print("\n6. Writing mapping files...")
-        write_mapping_files(element_content, set_content, mapping_dir, dry_run=False)
+        print("\n5. Writing mapping files...")
+        backup_paths = write_mapping_files(records, sets, mapping_dir, dry_run=False)
 
         # Update database
         if not args.no_db:
-            print("\n7. Updating database...")
+            print("\n6. Updating database...")
             update_database(records, sets, db_path, args.project, dry_run=False)
         else:
-            print("\n7. Skipping database update (--no-db)")
+            print("\n6. Skipping database update (--no-db)")
+
+        # Everything succeeded; drop the *.old rollback copies
+        for old in backup_paths.values():
+            old.unlink(missing_ok=True)
+        backup_paths = {}
 
         print("\n" + "=" * 60)
         print(f"✓ SUCCESS: Processed {len(records)} elements, {len(sets)} categories")
@@ -476,6 +539,7 @@ Examples:
             restore_from_backups(backup_paths, mapping_dir)
             print("✓ Files restored from backup")
 
+        sys.stdout.flush()
         sys.exit(1)
 
 
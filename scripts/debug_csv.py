@@ -39,9 +39,13 @@ try:
     if csv_path.exists():
         with open(csv_path, 'r', encoding='utf-8-sig') as f:
             reader = csv.DictReader(f)
-            rows = list(reader)
-            print(f"  Rows: {len(rows)}")
-            print(f"  First row: {rows[0] if rows else 'None'}")
+            # Stream the count instead of materializing every row
+            first = next(reader, None)
+            count = 1 if first else 0
+            for _ in reader:
+                count += 1
+            print(f"  Rows: {count}")
+            print(f"  First row: {first if first else 'None'}")
 
     print("\n✓ Debug complete - no errors!")
 
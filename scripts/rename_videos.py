@@ -9,19 +9,82 @@ To:
   Olympic_Men_SP#1_MONTOYA_Felipe.mp4
 
 Usage:
-  python scripts/rename_videos.py [--dry-run] [--video-dir PATH] [--csv PATH]
+  python scripts/rename_videos.py [--execute] [--video-dir PATH] [--csv PATH]
+
+Runs as a dry run unless --execute is given.
 """
 
 import csv
-import re
+import functools
+import io
+import os
 import sys
+from collections import Counter
 from pathlib import Path
 from typing import Dict, Tuple, Optional, List
 from dataclasses import dataclass
 import argparse
 
+# pandas is optional; when present the CSV ingest is vectorized
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
+
+
+@functools.lru_cache(maxsize=None)
+def _build_name(comp: str, gender: str, num: int, name: str) -> str:
+    """Format the target filename for one skater entry (memoized)"""
+    # Parse name (format: "LASTNAME Firstname" or just "NAME")
+    name_parts = name.split(maxsplit=1)
+    lastname = name_parts[0]
+    firstname = name_parts[1] if len(name_parts) == 2 else ""
+
+    comp_short = "Olympic" if comp == "Olympic" else "World"
+    if firstname:
+        return f"{comp_short}_{gender}_SP#{num:02d}_{lastname}_{firstname}.mp4"
+    return f"{comp_short}_{gender}_SP#{num:02d}_{lastname}.mp4"
+
+
+def _split_video_name(name: str) -> Optional[Tuple[str, str, str, str, str, str]]:
+    """
+    Tokenize a source video filename without a regex.
+
+    The schema is rigid ({gender}_{competition}_short_program_{year}_
+    {number}_{frame_start}_{frame_end}.mp4), so splitting on underscores
+    and validating each field is cheaper than running the NFA.
+
+    Returns (gender_raw, competition_raw, year, start_num, frame_start,
+    frame_end) as raw strings, or None if the name does not match.
+    """
+    if not name.endswith('.mp4'):
+        return None
+
+    parts = name[:-4].split('_')
+    if len(parts) != 8:
+        return None
+
+    gender_raw, competition_raw, sp, pg, year, start_num, frame_start, frame_end = parts
+    if (sp != 'short' or pg != 'program'
+            or gender_raw not in ('men', 'women')
+            or competition_raw not in ('olympic', 'world')
+            or not (len(year) == 4 and year.isdigit())
+            or not (start_num.isdigit() and frame_start.isdigit() and frame_end.isdigit())):
+        return None
+
+    return gender_raw, competition_raw, year, start_num, frame_start, frame_end
 
-@dataclass
+
+# (number column, name column, competition, gender) for each CSV block
+_CSV_COLS = (
+    (0, 1, "Olympic", "Men"),
+    (2, 3, "Olympic", "Women"),
+    (4, 5, "WorldChampionship", "Men"),
+    (6, 7, "WorldChampionship", "Women"),
+)
+
+
+@dataclass(slots=True, frozen=True)
 class SkaterInfo:
     """Skater information from CSV"""
     name: str
@@ -30,7 +93,7 @@ class SkaterInfo:
     gender: str  # "Men" or "Women"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class VideoFileInfo:
     """Parsed video file information"""
     original_path: Path
@@ -45,70 +108,89 @@ class VideoFileInfo:
 class VideoRenamer:
     """Handles video file renaming based on CSV data"""
 
-    def __init__(self, csv_path: Path, video_dir: Path):
+    def __init__(self, csv_path: Path, video_dir: Path, verbose: bool = True):
         self.csv_path = csv_path
         self.video_dir = video_dir
+        self.verbose = verbose
         self.skaters: Dict[Tuple[str, str, int], SkaterInfo] = {}
+        # New filename per (competition, gender, starting_number), built
+        # once at CSV load so the per-video path is a dict lookup
+        self.new_name_for: Dict[Tuple[str, str, int], str] = {}
+
+    def _add_skater(self, comp: str, gender: str, num: int, name: str) -> None:
+        """Register one skater and precompute the target filename"""
+        key = (comp, gender, num)
+        self.skaters[key] = SkaterInfo(name, num, comp, gender)
+        self.new_name_for[key] = _build_name(comp, gender, num, name)
+
+    def _parse_csv_vectorized(self) -> None:
+        """Columnwise ingest: stripping and digit screening run in pandas C"""
+        # Explicit names pin the table to the 8-column schema so a short
+        # first data row cannot drive column inference and make later,
+        # wider rows raise ParserError; usecols drops any stray trailing
+        # fields instead of letting pandas shift them into an index
+        df = pd.read_csv(self.csv_path, header=None, skiprows=2, dtype=str,
+                         names=range(8), usecols=range(8),
+                         encoding='utf-8-sig').fillna('')
+
+        for num_idx, name_idx, comp, gender in _CSV_COLS:
+            if name_idx >= df.shape[1]:
+                continue
+            nums = df[num_idx].str.strip()
+            names = df[name_idx].str.strip()
+            mask = nums.str.isdigit() & (names != '')
+            for num_s, name in zip(nums[mask], names[mask]):
+                self._add_skater(comp, gender, int(num_s), name)
+
+    def _parse_csv_python(self) -> None:
+        """Row-by-row fallback when pandas is not installed"""
+        # The CSV easily fits in RAM: one read syscall + one decode, then
+        # tokenize purely in memory
+        text = self.csv_path.read_text(encoding='utf-8-sig')
+        reader = csv.reader(io.StringIO(text))
+        headers = next(reader)  # Skip header row 1
+        column_headers = next(reader)  # Row with "Starting No.", "Name", etc.
+
+        # Process each data row; the four competition/gender blocks
+        # share one table-driven ingest loop
+        for row in reader:
+            if not row or not any(row):  # Skip empty rows
+                continue
+
+            n = len(row)
+            for num_idx, name_idx, comp, gender in _CSV_COLS:
+                if n <= name_idx:
+                    continue
+                num_s = row[num_idx].strip()
+                name = row[name_idx].strip()
+                # isdigit() instead of try/except keeps bad cells cheap
+                if num_s and name and num_s.isdigit():
+                    self._add_skater(comp, gender, int(num_s), name)
 
     def parse_csv(self) -> None:
         """Parse CSV file and build skater lookup dictionary"""
         print(f"Reading CSV: {self.csv_path}")
 
-        with open(self.csv_path, 'r', encoding='utf-8-sig') as f:
-            reader = csv.reader(f)
-            headers = next(reader)  # Skip header row 1
-            column_headers = next(reader)  # Row with "Starting No.", "Name", etc.
-
-            # Process each data row
-            for row in reader:
-                if not row or not any(row):  # Skip empty rows
-                    continue
-
-                # Men Olympic (columns 0-1)
-                if len(row) > 1 and row[0].strip() and row[1].strip():
-                    try:
-                        num = int(row[0].strip())
-                        name = row[1].strip()
-                        key = ("Olympic", "Men", num)
-                        self.skaters[key] = SkaterInfo(name, num, "Olympic", "Men")
-                    except ValueError:
-                        pass
-
-                # Women Olympic (columns 2-3)
-                if len(row) > 3 and row[2].strip() and row[3].strip():
-                    try:
-                        num = int(row[2].strip())
-                        name = row[3].strip()
-                        key = ("Olympic", "Women", num)
-                        self.skaters[key] = SkaterInfo(name, num, "Olympic", "Women")
-                    except ValueError:
-                        pass
-
-                # Men WorldChampionship (columns 4-5)
-                if len(row) > 5 and row[4].strip() and row[5].strip():
-                    try:
-                        num = int(row[4].strip())
-                        name = row[5].strip()
-                        key = ("WorldChampionship", "Men", num)
-                        self.skaters[key] = SkaterInfo(name, num, "WorldChampionship", "Men")
-                    except ValueError:
-                        pass
-
-                # Women WorldChampionship (columns 6-7)
-                if len(row) > 7 and row[6].strip() and row[7].strip():
-                    try:
-                        num = int(row[6].strip())
-                        name = row[7].strip()
-                        key = ("WorldChampionship", "Women", num)
-                        self.skaters[key] = SkaterInfo(name, num, "WorldChampionship", "Women")
-                    except ValueError:
-                        pass
+        if pd is not None:
+            try:
+                self._parse_csv_vectorized()
+            except pd.errors.ParserError:
+                # A ragged CSV the row-by-row path handles fine must not
+                # become a crash just because pandas is installed
+                self.skaters.clear()
+                self.new_name_for.clear()
+                self._parse_csv_python()
+        else:
+            self._parse_csv_python()
 
         print(f"  Loaded {len(self.skaters)} skater records")
-        print(f"    Men Olympic: {sum(1 for k in self.skaters.keys() if k[0] == 'Olympic' and k[1] == 'Men')}")
-        print(f"    Women Olympic: {sum(1 for k in self.skaters.keys() if k[0] == 'Olympic' and k[1] == 'Women')}")
-        print(f"    Men WorldChampionship: {sum(1 for k in self.skaters.keys() if k[0] == 'WorldChampionship' and k[1] == 'Men')}")
-        print(f"    Women WorldChampionship: {sum(1 for k in self.skaters.keys() if k[0] == 'WorldChampionship' and k[1] == 'Women')}")
+        if self.verbose:
+            # One pass over the keys tallies every category at once
+            counts = Counter((k[0], k[1]) for k in self.skaters)
+            print(f"    Men Olympic: {counts[('Olympic', 'Men')]}")
+            print(f"    Women Olympic: {counts[('Olympic', 'Women')]}")
+            print(f"    Men WorldChampionship: {counts[('WorldChampionship', 'Men')]}")
+            print(f"    Women WorldChampionship: {counts[('WorldChampionship', 'Women')]}")
 
     def parse_video_filename(self, filepath: Path) -> Optional[VideoFileInfo]:
         """
@@ -121,13 +203,12 @@ class VideoRenamer:
           men_olympic_short_program_2018_01_00019225_00023525.mp4
           women_world_short_program_2018_32_00458150_00462450.mp4
         """
-        pattern = r'^(men|women)_(olympic|world)_short_program_(\d{4})_(\d+)_(\d+)_(\d+)\.mp4$'
-        match = re.match(pattern, filepath.name)
+        fields = _split_video_name(filepath.name)
 
-        if not match:
+        if not fields:
             return None
 
-        gender_raw, competition_raw, year, start_num, frame_start, frame_end = match.groups()
+        gender_raw, competition_raw, year, start_num, frame_start, frame_end = fields
 
         # Normalize values
         gender = "Men" if gender_raw == "men" else "Women"
@@ -149,34 +230,43 @@ class VideoRenamer:
 
         Format: {Competition}_{Gender}_SP#{Number}_{LastName}_{FirstName}.mp4
         Example: Olympic_Men_SP#1_MONTOYA_Felipe.mp4
+
+        The filenames are precomputed in parse_csv, so this is a lookup.
         """
         key = (video_info.competition, video_info.gender, video_info.starting_number)
-        skater = self.skaters.get(key)
+        return self.new_name_for.get(key)
 
-        if not skater:
-            return None
+    def _plan(self, filepath: Path) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Fused parse + target lookup for one file, with no intermediate
+        VideoFileInfo allocation.
 
-        # Parse name (format: "LASTNAME Firstname" or just "NAME")
-        name_parts = skater.name.split(maxsplit=1)
-        if len(name_parts) == 2:
-            lastname, firstname = name_parts
-        else:
-            lastname = name_parts[0]
-            firstname = ""
+        Returns (new_filename, skip_reason); exactly one is non-None.
+        """
+        fields = _split_video_name(filepath.name)
+        if not fields:
+            return None, "Failed to parse filename"
 
-        # Build filename
-        comp_short = "Olympic" if video_info.competition == "Olympic" else "World"
+        gender_raw, competition_raw, _year, start_num, _fs, _fe = fields
+        gender = "Men" if gender_raw == "men" else "Women"
+        competition = "Olympic" if competition_raw == "olympic" else "WorldChampionship"
+        number = int(start_num)
 
-        if firstname:
-            new_name = f"{comp_short}_{video_info.gender}_SP#{video_info.starting_number:02d}_{lastname}_{firstname}.mp4"
-        else:
-            new_name = f"{comp_short}_{video_info.gender}_SP#{video_info.starting_number:02d}_{lastname}.mp4"
+        new_filename = self.new_name_for.get((competition, gender, number))
+        if not new_filename:
+            return None, f"No skater found for {competition} {gender} #{number}"
 
-        return new_name
+        return new_filename, None
 
     def find_video_files(self) -> List[Path]:
         """Find all video files in the video directory"""
-        video_files = list(self.video_dir.glob("*.mp4"))
+        # scandir + suffix test skips glob's selector machinery and only
+        # builds Path objects for actual matches
+        with os.scandir(self.video_dir) as it:
+            video_files = [
+                Path(entry.path) for entry in it
+                if entry.name.endswith('.mp4') and entry.is_file(follow_symlinks=False)
+            ]
         print(f"\nFound {len(video_files)} video files in {self.video_dir}")
         return video_files
 
@@ -196,27 +286,33 @@ class VideoRenamer:
         rename_plan: List[Tuple[Path, Path]] = []
         skipped: List[Tuple[Path, str]] = []
 
+        # Collision checks use the listing we already have instead of a
+        # stat() per planned target
+        existing_names = {p.name for p in video_files}
+
+        already_renamed = 0
+
         # Build rename plan
         for filepath in video_files:
-            video_info = self.parse_video_filename(filepath)
-
-            if not video_info:
-                skipped.append((filepath, "Failed to parse filename"))
+            # Files already in the target format need no parsing at all
+            if filepath.name.startswith(("Olympic_", "World_")):
+                already_renamed += 1
                 continue
 
-            new_filename = self.generate_new_filename(video_info)
+            new_filename, skip_reason = self._plan(filepath)
 
             if not new_filename:
-                skipped.append((filepath, f"No skater found for {video_info.competition} {video_info.gender} #{video_info.starting_number}"))
+                skipped.append((filepath, skip_reason))
                 continue
 
             new_path = filepath.parent / new_filename
 
-            if new_path.exists() and new_path != filepath:
+            if new_filename in existing_names and new_filename != filepath.name:
                 skipped.append((filepath, f"Target already exists: {new_filename}"))
                 continue
 
             rename_plan.append((filepath, new_path))
+            existing_names.add(new_filename)
 
         # Display results
         print("\n" + "=" * 80)
@@ -226,21 +322,26 @@ class VideoRenamer:
             print("RENAMING FILES")
         print("=" * 80)
 
+        # Buffer the per-file report lines and write each section once
+        # instead of three print calls per file
         if rename_plan:
-            print(f"\nFiles to rename ({len(rename_plan)}):")
-            print("-" * 80)
-            for old_path, new_path in rename_plan:
-                print(f"  {old_path.name}")
-                print(f"  → {new_path.name}")
-                print()
+            lines = [f"\nFiles to rename ({len(rename_plan)}):\n"]
+            if self.verbose:
+                lines.append("-" * 80 + "\n")
+                for old_path, new_path in rename_plan:
+                    lines.append(f"  {old_path.name}\n  → {new_path.name}\n\n")
+            sys.stdout.write(''.join(lines))
 
         if skipped:
-            print(f"\nSkipped files ({len(skipped)}):")
-            print("-" * 80)
-            for filepath, reason in skipped:
-                print(f"  {filepath.name}")
-                print(f"  Reason: {reason}")
-                print()
+            lines = [f"\nSkipped files ({len(skipped)}):\n"]
+            if self.verbose:
+                lines.append("-" * 80 + "\n")
+                for filepath, reason in skipped:
+                    lines.append(f"  {filepath.name}\n  Reason: {reason}\n\n")
+            sys.stdout.write(''.join(lines))
+
+        if already_renamed:
+            print(f"\nAlready renamed ({already_renamed} files, left untouched)")
 
         # Execute renames if not dry run
         if not dry_run and rename_plan:
@@ -248,22 +349,38 @@ class VideoRenamer:
             success_count = 0
             error_count = 0
 
-            for old_path, new_path in rename_plan:
-                try:
-                    old_path.rename(new_path)
-                    print(f"  ✓ Renamed: {old_path.name} → {new_path.name}")
-                    success_count += 1
-                except Exception as e:
-                    print(f"  ✗ Failed: {old_path.name} - {e}")
-                    error_count += 1
+            # Open the directory once and rename by leaf name relative to
+            # it, so the kernel skips the full path walk per file; fall
+            # back to Path.rename where dir_fd is unsupported (Windows)
+            dirfd = None
+            if os.rename in os.supports_dir_fd:
+                dirfd = os.open(self.video_dir, os.O_RDONLY | os.O_DIRECTORY)
+
+            try:
+                for old_path, new_path in rename_plan:
+                    try:
+                        if dirfd is not None:
+                            os.rename(old_path.name, new_path.name,
+                                      src_dir_fd=dirfd, dst_dir_fd=dirfd)
+                        else:
+                            old_path.rename(new_path)
+                        if self.verbose:
+                            print(f"  ✓ Renamed: {old_path.name} → {new_path.name}")
+                        success_count += 1
+                    except Exception as e:
+                        print(f"  ✗ Failed: {old_path.name} - {e}")
+                        error_count += 1
+            finally:
+                if dirfd is not None:
+                    os.close(dirfd)
 
             print("\n" + "=" * 80)
             print(f"Rename complete: {success_count} succeeded, {error_count} failed")
             print("=" * 80)
         elif dry_run and rename_plan:
             print("\n" + "=" * 80)
-            print("To execute these renames, run without --dry-run:")
-            print("  python scripts/rename_videos.py")
+            print("To execute these renames, run with --execute:")
+            print("  python scripts/rename_videos.py --execute")
             print("=" * 80)
 
 
@@ -271,16 +388,16 @@ def main():
     parser = argparse.ArgumentParser(
         description="Rename video files based on skater information from CSV"
     )
+    # Dry run is the default; only --execute touches files
     parser.add_argument(
-        '--dry-run',
+        '--execute',
         action='store_true',
-        default=True,
-        help='Show what would be renamed without making changes (default: True)'
+        help='Actually rename files (default is a dry run)'
     )
     parser.add_argument(
-        '--execute',
+        '--quiet',
         action='store_true',
-        help='Actually rename files (overrides --dry-run)'
+        help='Only print summaries, not per-file details'
     )
     parser.add_argument(
         '--video-dir',
@@ -297,9 +414,8 @@ def main():
 
     args = parser.parse_args()
 
-    # Determine paths
-    script_dir = Path(__file__).parent
-    project_root = script_dir.parent
+    # Determine paths; resolve once instead of per lookup
+    project_root = Path(__file__).resolve().parent.parent
 
     csv_path = args.csv or project_root / 'starting_number_skaters_name.csv'
     video_dir = args.video_dir or project_root / 'backend' / 'videos' / 'optimized'
@@ -325,7 +441,7 @@ def main():
     print("=" * 80)
 
     # Execute renaming
-    renamer = VideoRenamer(csv_path, video_dir)
+    renamer = VideoRenamer(csv_path, video_dir, verbose=not args.quiet)
 
     try:
         renamer.parse_csv()
@@ -4,6 +4,30 @@
 from pathlib import Path
 import sys
 
+
+def _split_name(filename):
+    """Split-based parse of the fixed-shape original filenames.
+
+    The layout has a known number of '_'-separated fields, so one
+    str.split plus literal checks replaces the regex (same approach as
+    rename_videos.py).  Returns the six fields or None on mismatch.
+    """
+    if not filename.endswith('.mp4'):
+        return None
+    parts = filename[:-4].split('_')
+    if len(parts) != 8:
+        return None
+    gender_raw, competition_raw, lit1, lit2, year, start_num, frame_start, frame_end = parts
+    if (gender_raw not in ('men', 'women')
+            or competition_raw not in ('olympic', 'world')
+            or lit1 != 'short' or lit2 != 'program'
+            or len(year) != 4 or not year.isdigit()
+            or not start_num.isdigit()
+            or not frame_start.isdigit() or not frame_end.isdigit()):
+        return None
+    return gender_raw, competition_raw, year, start_num, frame_start, frame_end
+
+
 # Test parsing a few filenames
 test_files = [
     "men_olympic_short_program_2018_01_00019225_00023525.mp4",
@@ -11,14 +35,11 @@ test_files = [
 ]
 
 print("Testing filename parsing:")
-import re
-
-pattern = r'^(men|women)_(olympic|world)_short_program_(\d{4})_(\d+)_(\d+)_(\d+)\.mp4$'
 
 for filename in test_files:
-    match = re.match(pattern, filename)
-    if match:
-        gender_raw, competition_raw, year, start_num, frame_start, frame_end = match.groups()
+    parsed = _split_name(filename)
+    if parsed:
+        gender_raw, competition_raw, year, start_num, frame_start, frame_end = parsed
         gender = "Men" if gender_raw == "men" else "Women"
         competition = "Olympic" if competition_raw == "olympic" else "WorldChampionship"
         print(f"\n{filename}")